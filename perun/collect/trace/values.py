@@ -155,7 +155,6 @@ TraceRecord = collections.namedtuple(
 GLOBAL_DEPENDENCIES = ['ps', 'grep', 'awk', 'nm']
 
 STAP_PHASES = 5  # The number of SystemTap startup phases
-LOCK_SUFFIX_LEN = 7  # Suffix length of the lock files
 MICRO_TO_SECONDS = 1000000.0  # The conversion constant for collected time records
 NANO_TO_SECONDS = 1000000000.0  # The conversion constant for collected time records
 DEFAULT_SAMPLE = 20  # The default global sampling for 'sample' strategies if not set by user
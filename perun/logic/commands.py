@@ -6,10 +6,13 @@ possible to be run in isolation.
 """
 
 import collections
+import concurrent.futures
+import functools
 import os
 import re
+import sys
 
-from operator import itemgetter
+from operator import attrgetter, itemgetter
 
 import colorama
 
@@ -28,7 +31,7 @@ import perun.logic.stats as stats
 
 from perun.utils.exceptions import NotPerunRepositoryException, \
     ExternalEditorErrorException, MissingConfigSectionException, InvalidTempPathException, \
-    ProtectedTempException
+    ProtectedTempException, EntryNotFoundException
 from perun.utils.helpers import \
     TEXT_EMPH_COLOUR, TEXT_ATTRS, TEXT_WARN_COLOUR, \
     PROFILE_TYPE_COLOURS, SUPPORTED_PROFILE_TYPES, HEADER_ATTRS, HEADER_COMMIT_COLOUR, \
@@ -42,6 +45,8 @@ UNTRACKED_REGEX = \
     re.compile(r"([^\\]+)-([0-9]{4}-[0-9]{2}-[0-9]{2}-[0-9]{2}-[0-9]{2}-[0-9]{2}).perf")
 # Regex for parsing the formating tag [<tag>:<size>f<fill_char>]
 FMT_REGEX = re.compile(r"%([a-zA-Z]+)(:[0-9]+)?(f.)?%")
+# Mapping of classes of the printed objects to their attributes usable in formatting strings
+FORMATTING_ATTRIBUTES = {}
 
 
 def config_get(store_type, key):
@@ -193,10 +198,12 @@ def init(dst, configuration_template='master', **kwargs):
         perun_log.error(err_msg)
 
 
-@vcs.lookup_minor_version
 def add(profile_names, minor_version, keep_profile=False, force=False):
     """Appends @p profile to the @p minor_version inside the @p pcs
 
+    The profiles are materialized into the list only once. If there are no profiles to add,
+    the lookup of the minor version is skipped altogether.
+
     :param generator profile_names: generator of profiles that will be stored for the minor version
     :param str minor_version: SHA-1 representation of the minor version
     :param bool keep_profile: if true, then the profile that is about to be added will be not
@@ -204,53 +211,60 @@ def add(profile_names, minor_version, keep_profile=False, force=False):
     :param bool force: if set to true, then the add will be forced, i.e. the check for origin will
         not be performed.
     """
-    added_profile_count = 0
-    for profile_name in profile_names:
-        # Test if the given profile exists (This should hold always, or not?)
-        if not os.path.exists(profile_name):
-            perun_log.error("profile {} does not exists".format(profile_name), recoverable=True)
-            continue
-
-        # Load profile content
-        # Unpack to JSON representation
-        unpacked_profile = store.load_profile_from_file(profile_name, True)
-
-        if not force and unpacked_profile['origin'] != minor_version:
-            error_msg = "cannot add profile '{}' to minor index of '{}':".format(
-                profile_name, minor_version
-            )
-            error_msg += "profile originates from minor version '{}'".format(
-                unpacked_profile['origin']
-            )
-            perun_log.error(error_msg, recoverable=True)
-            continue
-
-        # Remove origin from file
-        unpacked_profile.pop('origin')
-        profile_content = profile.to_string(unpacked_profile)
-
-        # Append header to the content of the file
-        header = "profile {} {}\0".format(unpacked_profile['header']['type'], len(profile_content))
-        profile_content = (header + profile_content).encode('utf-8')
+    profile_names = list(profile_names)
+    if not profile_names:
+        perun_log.info("no profiles to add")
+        return
+    _add_to_minor_version(profile_names, minor_version, keep_profile, force)
 
-        # Transform to internal representation - file as sha1 checksum and content packed with zlib
-        profile_sum = store.compute_checksum(profile_content)
-        compressed_content = store.pack_content(profile_content)
 
-        # Add to control
-        object_dir = pcs.get_object_directory()
-        store.add_loose_object_to_dir(object_dir, profile_sum, compressed_content)
+@vcs.lookup_minor_version
+def _add_to_minor_version(profile_names, minor_version, keep_profile, force):
+    """Appends the list of @p profile_names to the @p minor_version inside the @p pcs
 
-        # Register in the minor_version index
-        index.register_in_minor_index(
-            object_dir, minor_version, profile_name, profile_sum, unpacked_profile
-        )
+    :param list profile_names: list of profiles that will be stored for the minor version
+    :param str minor_version: SHA-1 representation of the minor version
+    :param bool keep_profile: if true, then the added profiles will be kept as they are
+    :param bool force: if set to true, then the check for origin will not be performed
+    """
+    added_profile_count = 0
+    object_dir = pcs.get_object_directory()
+    prepare_profile = functools.partial(
+        prepare_profile_for_index, minor_version=minor_version, force=force
+    )
+    # Loading, hashing and packing of the profiles is independent for each of the profiles and
+    # is mostly done in C, hence it can be run in parallel; the storing is done in order.
+    # The profiles are prepared in windows of the size of the pool, so only few of the (possibly
+    # large) loaded profiles are kept in the memory at once.
+    window_size = os.cpu_count() or 1
+    with concurrent.futures.ThreadPoolExecutor(max_workers=window_size) as executor:
+        for window_start in range(0, len(profile_names), window_size):
+            prepared_profiles = executor.map(
+                prepare_profile, profile_names[window_start:window_start + window_size]
+            )
+            for profile_name, error_msg, unpacked_profile, profile_sum, compressed_content \
+                    in prepared_profiles:
+                # The profile might have been already removed since it was prepared, e.g. when
+                # the same profile was listed twice, hence its existence is checked once more
+                if not error_msg and not os.path.exists(profile_name):
+                    error_msg = "profile {} does not exists".format(profile_name)
+                if error_msg:
+                    perun_log.error(error_msg, recoverable=True)
+                    continue
+
+                # Add to control
+                store.add_loose_object_to_dir(object_dir, profile_sum, compressed_content)
+
+                # Register in the minor_version index
+                index.register_in_minor_index(
+                    object_dir, minor_version, profile_name, profile_sum, unpacked_profile
+                )
 
-        # Remove the file
-        if not keep_profile:
-            os.remove(profile_name)
+                # Remove the file
+                if not keep_profile:
+                    os.remove(profile_name)
 
-        added_profile_count += 1
+                added_profile_count += 1
 
     profile_names_len = len(profile_names)
     if added_profile_count != profile_names_len:
@@ -261,6 +275,50 @@ def add(profile_names, minor_version, keep_profile=False, force=False):
     perun_log.info("successfully registered {} profiles in index".format(added_profile_count))
 
 
+def prepare_profile_for_index(profile_name, minor_version, force):
+    """Loads the profile and transforms it to the internal representation of the stored objects
+
+    The profile is converted to the file with sha1 checksum and the content packed with zlib.
+    The errors are returned instead of being reported, so they are output in the order of the
+    profiles, regardless of the order in which the profiles are prepared.
+
+    :param str profile_name: path to the profile that is about to be added
+    :param str minor_version: SHA-1 representation of the minor version
+    :param bool force: if set to true, then the check for origin will not be performed
+    :return: tuple of (profile name, error message, unpacked profile, checksum, packed content),
+        where either the error message or the rest of the values is None
+    """
+    # Test if the given profile exists (This should hold always, or not?)
+    if not os.path.exists(profile_name):
+        return profile_name, "profile {} does not exists".format(profile_name), None, None, None
+
+    # Load profile content
+    # Unpack to JSON representation
+    unpacked_profile = store.load_profile_from_file(profile_name, True)
+
+    if not force and unpacked_profile['origin'] != minor_version:
+        error_msg = "cannot add profile '{}' to minor index of '{}':".format(
+            profile_name, minor_version
+        )
+        error_msg += "profile originates from minor version '{}'".format(
+            unpacked_profile['origin']
+        )
+        return profile_name, error_msg, None, None, None
+
+    # Remove origin from file
+    unpacked_profile.pop('origin')
+    profile_content = profile.to_string(unpacked_profile)
+
+    # Prepend header to the content of the file
+    header = "profile {} {}\0".format(unpacked_profile['header']['type'], len(profile_content))
+
+    # Transform to internal representation - file as sha1 checksum and content packed with zlib
+    profile_sum, compressed_content = store.pack_and_hash(
+        (header.encode('utf-8'), profile_content.encode('utf-8'))
+    )
+    return profile_name, None, unpacked_profile, profile_sum, compressed_content
+
+
 @vcs.lookup_minor_version
 def remove_from_index(profile_generator, minor_version):
     """Removes @p profile from the @p minor_version inside the @p pcs
@@ -306,9 +364,9 @@ def calculate_profile_numbers_per_type(profile_list):
     :param list profile_list: list of ProfileInfo with information about profiles
     :returns dict: dictionary mapping profile types to number of profiles of given type in the list
     """
-    profile_numbers = collections.defaultdict(int)
-    for profile_info in profile_list:
-        profile_numbers[profile_info.type] += 1
+    profile_numbers = collections.defaultdict(
+        int, collections.Counter(profile_info.type for profile_info in profile_list)
+    )
     profile_numbers['all'] = len(profile_list)
     return profile_numbers
 
@@ -376,6 +434,7 @@ def log(minor_version, short=False, **_):
     :param bool short: true if the log should be in short format
     """
     perun_log.msg_to_stdout("Running inner wrapper of the 'perun log '", 2)
+    object_directory = pcs.get_object_directory()
 
     # Print header for --short-minors
     if short:
@@ -386,6 +445,15 @@ def log(minor_version, short=False, **_):
         minor_version_maxima = calculate_maximal_lengths_for_object_list(
             minor_versions, MinorVersion._fields
         )
+        # Load the stats and degradations of each minor version only once, since they are needed
+        # both for computing the maxima and for printing the rows
+        stats_cache = index.get_profile_numbers_for_minors(
+            object_directory, [minor.checksum for minor in minor_versions]
+        )
+        deg_cache = {
+            minor.checksum: store.load_degradation_list_for(object_directory, minor.checksum)
+            for minor in minor_versions
+        }
         # Update manually the maxima for the printed supported profile types, each requires two
         # characters and 9 stands for " profiles" string
 
@@ -395,9 +463,7 @@ def log(minor_version, short=False, **_):
             :param MinorVersion minor_v: minor version for which we are retrieving the stats
             :return: dictionary with stats for minor version
             """
-            return index.get_profile_number_for_minor(
-                pcs.get_object_directory(), minor_v.checksum
-            )
+            return stats_cache[minor_v.checksum]
 
         def deg_count_retriever(minor_v):
             """Helper function for picking stats of the degradation strings of form ++--
@@ -405,9 +471,7 @@ def log(minor_version, short=False, **_):
             :param MinorVersion minor_v: minor version for which we are retrieving the stats
             :return: dictionary with stats for minor version
             """
-            counts = perun_log.count_degradations_per_group(
-                store.load_degradation_list_for(pcs.get_object_directory(), minor_v.checksum)
-            )
+            counts = perun_log.count_degradations_per_group(deg_cache[minor_v.checksum])
             return {'changes': counts.get('Optimization', 0)*'+' + counts.get('Degradation', 0)*'-'}
 
         minor_version_maxima.update(
@@ -416,13 +480,16 @@ def log(minor_version, short=False, **_):
         minor_version_maxima.update(
             calculate_maximal_lengths_for_stats(minor_versions, deg_count_retriever, " changes ")
         )
-        print_shortlog_minor_version_info_list(minor_versions, minor_version_maxima)
+        print_shortlog_minor_version_info_list(
+            minor_versions, minor_version_maxima, stats_cache, deg_cache
+        )
     else:
         # Walk the minor versions and print them
         for minor in vcs.walk_minor_versions(minor_version):
             cprintln("Minor Version {}".format(minor.checksum), TEXT_EMPH_COLOUR, attrs=TEXT_ATTRS)
-            base_dir = pcs.get_object_directory()
-            tracked_profiles = index.get_profile_number_for_minor(base_dir, minor.checksum)
+            tracked_profiles = index.get_profile_number_for_minor(
+                object_directory, minor.checksum
+            )
             print_profile_numbers(tracked_profiles, 'tracked')
             print_minor_version_info(minor, indent=1)
 
@@ -443,7 +510,32 @@ def adjust_limit(limit, attr_type, maxima, padding=0):
     return max(int(limit[1:]), len(attr_type)) if limit else maxima[attr_type] + padding
 
 
-def print_shortlog_minor_version_info_list(minor_version_list, max_lengths):
+@functools.lru_cache(maxsize=32)
+def parse_formatting_string(fmt):
+    """Parses the formatting string into tokens with their attribute types, limits and fills
+
+    The formatting tags are found by a single pass of ``FMT_REGEX.finditer`` over the whole
+    formatting string, so each tag is matched only once and directly yields its attribute type,
+    limit and fill. The raw strings between the tags are kept as they are with no limit and fill.
+    The formatting strings are constant during one run, hence the results are memoized.
+
+    :param str fmt: formatting string
+    :return: tuple of quadruples of (token type, attribute type or token, limit, fill)
+    """
+    fmt_tokens = []
+    raw_start = 0
+    for fmt_match in FMT_REGEX.finditer(fmt):
+        if fmt_match.start() > raw_start:
+            fmt_tokens.append(('raw_string', fmt[raw_start:fmt_match.start()], None, None))
+        fmt_tokens.append(('fmt_string', *fmt_match.groups()))
+        raw_start = fmt_match.end()
+    if raw_start < len(fmt):
+        fmt_tokens.append(('raw_string', fmt[raw_start:], None, None))
+    return tuple(fmt_tokens)
+
+
+def print_shortlog_minor_version_info_list(minor_version_list, max_lengths, stats_cache,
+                                           deg_cache):
     """Prints list of profiles and counts per type of tracked/untracked profiles.
 
     Prints the list of profiles, trims the sizes of each information according to the
@@ -458,13 +550,13 @@ def print_shortlog_minor_version_info_list(minor_version_list, max_lengths):
 
     :param list minor_version_list: list of profiles of MinorVersionInfo objects
     :param dict max_lengths: dictionary with maximal sizes for the output of profiles
+    :param dict stats_cache: mapping of minor version checksums to numbers of tracked profiles
+    :param dict deg_cache: mapping of minor version checksums to lists of degradations
     """
 
     # Load formating string for profile
     minor_version_info_fmt = perun_config.lookup_key_recursively('format.shortlog')
-    fmt_tokens = perun_log.scan_formatting_string(
-        minor_version_info_fmt, {}, default_fmt_callback=lambda token: "%" + token + "%"
-    )
+    fmt_tokens = parse_formatting_string(minor_version_info_fmt)
 
     # Print header (2 is padding for id), e.g.:
     # checksum ( a|m|x|t profiles)                  desc                        changes
@@ -473,10 +565,13 @@ def print_shortlog_minor_version_info_list(minor_version_list, max_lengths):
     # Print profiles, e.g.:
     # aac4d21a (24|0|0|0 profiles) Bump version and changelog to 0.17.2
     # 91373c43 ( 2|0|0|2 profiles) Bump version and changelog to 0.16.8
-    print_shortlog_profile_list(fmt_tokens, max_lengths, minor_version_info_fmt, minor_version_list)
+    print_shortlog_profile_list(
+        fmt_tokens, max_lengths, minor_version_info_fmt, minor_version_list, stats_cache, deg_cache
+    )
 
 
-def print_shortlog_profile_list(tokens, max_lengths, fmt_string, minor_versions):
+def print_shortlog_profile_list(tokens, max_lengths, fmt_string, minor_versions, stats_cache,
+                                deg_cache):
     """For each minor versions, prints the stats w.r.t to the formatting tokens specified in
     @p tokens.
 
@@ -490,28 +585,35 @@ def print_shortlog_profile_list(tokens, max_lengths, fmt_string, minor_versions)
     91373c43 ( 2|0|0|2 profiles) Bump version and changelog to 0.16.8
     <token->  <-----token----->  <--------------token--------------->
 
-    :param list tokens: list of formatting tokens
+    :param list tokens: list of parsed formatting tokens
     :param dict max_lengths: dictionary mapping the maximal lengths of each value corresponding to
         column of the formatting token
     :param str fmt_string: formatting string
     :param list minor_versions: list of profiles of MinorVersionInfo objects
+    :param dict stats_cache: mapping of minor version checksums to numbers of tracked profiles
+    :param dict deg_cache: mapping of minor version checksums to lists of degradations
     """
-    stat_length = sum([
-        max_lengths['all'], max_lengths['time'], max_lengths['mixed'], max_lengths['memory']
-    ]) + 3 + len(" profiles")
+    stats_templates = build_stats_templates(max_lengths)
 
     for minor_version in minor_versions:
-        for (token_type, token) in tokens:
+        # Each row is first built from its tokens and then written to the output at once
+        row = []
+        for (token_type, token, limit, fill) in tokens:
             if token_type == 'fmt_string':
-                print_shortlog_token(fmt_string, max_lengths, minor_version, stat_length, token)
+                row.append(format_shortlog_token(
+                    fmt_string, max_lengths, minor_version, stats_templates, token, limit, fill,
+                    stats_cache, deg_cache
+                ))
             # Non-token parts of the formatting string are printed as they are
             else:
-                cprint(token, 'white')
-        perun_log.info("")
+                row.append(perun_log.in_color(token, 'white'))
+        row.append("\n")
+        sys.stdout.write("".join(row))
 
 
-def print_shortlog_token(fmt_string, max_lengths, minor_version, stat_len, token):
-    """Prints token of the formatting string.
+def format_shortlog_token(fmt_string, max_lengths, minor_version, stats_templates, attr_type,
+                          limit, fill, stats_cache, deg_cache):
+    """Formats token of the formatting string.
 
     Example of tokens are highlighted below:
 
@@ -523,81 +625,91 @@ def print_shortlog_token(fmt_string, max_lengths, minor_version, stat_len, token
         column of the formatting token
     :param str fmt_string: formating string
     :param MinorVersionInfo minor_version: MinorVersionInfo objects
-    :param int stat_len: the whole length of the formatting header
-    :param string token: one given token of formatting string
+    :param tuple stats_templates: pair of coloured templates of the stats token (see
+        :func:`build_stats_templates`)
+    :param str attr_type: attribute of the formatting token
+    :param str limit: matched limit of the formatting token (e.g. ':6') or None
+    :param str fill: matched fill of the formatting token (e.g. 'f-') or None
+    :param dict stats_cache: mapping of minor version checksums to numbers of tracked profiles
+    :param dict deg_cache: mapping of minor version checksums to lists of degradations
+    :return: coloured string of the token
     """
-    attr_type, limit, fill = FMT_REGEX.match(token).groups()
     limit = max(int(limit[1:]), len(attr_type)) if limit else max_lengths[attr_type]
     if attr_type == 'stats':
         # (24|0|0|0 profiles)
-        print_stats_token(max_lengths, minor_version, stat_len)
+        return format_stats_token(stats_templates, stats_cache[minor_version.checksum])
     elif attr_type == 'changes':
         # +++---
-        print_changes_token(max_lengths, minor_version)
-    else:
-        # "91373c43",  "Bump version and changelog to 0.16.8"
-        print_other_formatting_string(
-            fmt_string, minor_version, attr_type, limit, value_fill=fill or ' '
-        )
+        return format_changes_token(max_lengths, deg_cache[minor_version.checksum])
+    # "91373c43",  "Bump version and changelog to 0.16.8"
+    return format_other_formatting_string(
+        fmt_string, minor_version, attr_type, limit, value_fill=fill or ' '
+    )
 
 
-def print_changes_token(max_lengths, minor_version):
-    """Prints information about changes in the minor version, i.e. optimizations and degradations.
+def format_changes_token(max_lengths, degradations):
+    """Formats information about changes in the minor version, i.e. optimizations and degradations.
 
     The example of changes token is: "+++---"
 
     :param dict max_lengths: dictionary mapping the maximal lengths of each value corresponding to
         column of the formatting token
-    :param MinorVersionInfo minor_version: MinorVersionInfo objects
+    :param list degradations: list of degradations stored for the minor version
+    :return: coloured string of the changes
     """
-    degradations = store.load_degradation_list_for(
-        pcs.get_object_directory(), minor_version.checksum
-    )
-    change_string = perun_log.change_counts_to_string(
+    return perun_log.change_counts_to_string(
         perun_log.count_degradations_per_group(degradations),
         width=max_lengths['changes']
     )
-    perun_log.info(change_string, end='')
 
 
-def print_stats_token(max_lengths, minor_version, stat_length):
-    """Prints the statistic of profiles for the given minor versions.
+def build_stats_templates(max_lengths):
+    """Builds the coloured templates of the stats token adjusted to the maximal lengths
 
-    The example of stats token is: "(24|0|0|0 profiles)"
+    The constant parts of the token (i.e. the colours, delimiters and suffix) are the same for
+    each of the printed minor versions, hence they are built only once for the whole list and
+    each row then only formats the numbers of its profiles into the template.
 
     :param dict max_lengths: dictionary mapping the maximal lengths of each value corresponding to
         column of the formatting token
-    :param MinorVersionInfo minor_version: MinorVersionInfo objects
-    :param int stat_length: the whole length of the formatting header
+    :return: pair of template for numbers of profiles and string for minor versions without
+        profiles
     """
-    tracked_profiles = index.get_profile_number_for_minor(
-        pcs.get_object_directory(), minor_version.checksum
-    )
-    if tracked_profiles['all']:
-        perun_log.info(perun_log.in_color("{:{}}".format(
-            tracked_profiles['all'], max_lengths['all']
-        ), TEXT_EMPH_COLOUR, TEXT_ATTRS), end='')
+    stat_length = sum([
+        max_lengths['all'], max_lengths['time'], max_lengths['mixed'], max_lengths['memory']
+    ]) + 3 + len(" profiles")
+    slash = perun_log.in_color(PROFILE_DELIMITER, HEADER_SLASH_COLOUR)
 
-        # Print the coloured numbers
-        for profile_type in SUPPORTED_PROFILE_TYPES:
-            perun_log.info("{}{}".format(
-                perun_log.in_color(PROFILE_DELIMITER, HEADER_SLASH_COLOUR),
-                perun_log.in_color("{:{}}".format(
-                    tracked_profiles[profile_type], max_lengths[profile_type]
-                ), PROFILE_TYPE_COLOURS[profile_type])
-            ), end='')
-
-        perun_log.info(
-            perun_log.in_color(
-                " profiles", HEADER_INFO_COLOUR, TEXT_ATTRS
-            ), end=''
-        )
-    else:
-        perun_log.info(
-            perun_log.in_color(
-                '--no--profiles--'.center(stat_length), TEXT_WARN_COLOUR, TEXT_ATTRS
-            ), end=''
+    numbers_template = perun_log.in_color(
+        "{{0[all]:{}}}".format(max_lengths['all']), TEXT_EMPH_COLOUR, TEXT_ATTRS
+    )
+    for profile_type in SUPPORTED_PROFILE_TYPES:
+        numbers_template += slash + perun_log.in_color(
+            "{{0[{}]:{}}}".format(profile_type, max_lengths[profile_type]),
+            PROFILE_TYPE_COLOURS[profile_type]
         )
+    numbers_template += perun_log.in_color(" profiles", HEADER_INFO_COLOUR, TEXT_ATTRS)
+
+    no_profiles = perun_log.in_color(
+        '--no--profiles--'.center(stat_length), TEXT_WARN_COLOUR, TEXT_ATTRS
+    )
+    return numbers_template, no_profiles
+
+
+def format_stats_token(stats_templates, tracked_profiles):
+    """Formats the statistic of profiles for the given minor versions.
+
+    The example of stats token is: "(24|0|0|0 profiles)"
+
+    :param tuple stats_templates: pair of coloured templates of the stats token (see
+        :func:`build_stats_templates`)
+    :param dict tracked_profiles: numbers of tracked profiles of the minor version per type
+    :return: coloured string of the stats
+    """
+    numbers_template, no_profiles = stats_templates
+    if tracked_profiles['all']:
+        return numbers_template.format(tracked_profiles)
+    return no_profiles
 
 
 def print_shortlog_profile_list_header(fmt_tokens, max_lengths):
@@ -607,34 +719,36 @@ def print_shortlog_profile_list_header(fmt_tokens, max_lengths):
 
     checksum ( a|m|x|t profiles)                  desc                        changes
 
-    :param list fmt_tokens: list of formatting tokens
+    :param list fmt_tokens: list of parsed formatting tokens
     :param dict max_lengths: dictionary of maximal values of columns corresponding to the tokens
     """
-    for (token_type, token) in fmt_tokens:
+    header = []
+    for (token_type, token, limit, _) in fmt_tokens:
         if token_type == 'fmt_string':
-            attr_type, limit, _ = FMT_REGEX.match(token).groups()
-            if attr_type == 'stats':
-                print_shortlog_stats_header(max_lengths)
+            if token == 'stats':
+                header.append(format_shortlog_stats_header(max_lengths))
             else:
-                limit = adjust_limit(limit, attr_type, max_lengths)
-                token_string = attr_type.center(limit, ' ')
-                cprint(token_string, 'white', HEADER_ATTRS)
+                limit = adjust_limit(limit, token, max_lengths)
+                token_string = token.center(limit, ' ')
+                header.append(perun_log.in_color(token_string, 'white', HEADER_ATTRS))
         else:
             # Print the rest (non token stuff)
-            cprint(token, 'white', HEADER_ATTRS)
-    perun_log.info("")
+            header.append(perun_log.in_color(token, 'white', HEADER_ATTRS))
+    header.append("\n")
+    sys.stdout.write("".join(header))
 
 
-def print_shortlog_stats_header(max_lengths):
-    """Prints header for the stats, adjusted according to the lengths of each profile info
+def format_shortlog_stats_header(max_lengths):
+    """Formats header for the stats, adjusted according to the lengths of each profile info
 
     The stats header is in form of: a|m|x|t profiles
 
     :param dict max_lengths: dictionary that computes the maximal lengths of each column
+    :return: coloured string of the stats header
     """
     slash = perun_log.in_color(PROFILE_DELIMITER, HEADER_SLASH_COLOUR, HEADER_ATTRS)
     end_msg = perun_log.in_color(' profiles', HEADER_SLASH_COLOUR, HEADER_ATTRS)
-    perun_log.info(perun_log.in_color("{0}{4}{1}{4}{2}{4}{3}{5}".format(
+    return perun_log.in_color("{0}{4}{1}{4}{2}{4}{3}{5}".format(
         perun_log.in_color(
             'a'.rjust(max_lengths['all']), HEADER_COMMIT_COLOUR, HEADER_ATTRS
         ),
@@ -650,7 +764,7 @@ def print_shortlog_stats_header(max_lengths):
             PROFILE_TYPE_COLOURS['time'], HEADER_ATTRS),
         slash,
         end_msg
-    ), HEADER_SLASH_COLOUR, HEADER_ATTRS), end='')
+    ), HEADER_SLASH_COLOUR, HEADER_ATTRS)
 
 
 def print_minor_version_info(head_minor_version, indent=0):
@@ -671,19 +785,35 @@ def print_minor_version_info(head_minor_version, indent=0):
     for parent in head_minor_version.parents:
         perun_log.info("Parent: {}".format(parent))
     perun_log.info("")
-    indented_desc = '\n'.join(map(
-        lambda line: ' '*(indent*4) + line, head_minor_version.desc.split('\n')
-    ))
+    prefix = ' ' * (indent * 4)
+    indented_desc = prefix + head_minor_version.desc.replace('\n', '\n' + prefix)
     perun_log.info(indented_desc)
 
 
-def print_other_formatting_string(fmt_string, info_object, info_attr, size_limit,
-                                  colour='white', value_fill=' '):
-    """Prints the token from the fmt_string, according to the values stored in info_object
+def get_formatting_attributes(info_object):
+    """Returns the set of attributes of the info_object, that can be used in formatting strings
+
+    The objects of the same class (e.g. ProfileInfo or MinorVersion) have the same attributes,
+    hence the set is computed only once per class.
+
+    :param object info_object: object (either named tuple or object) with the info
+    :return: set of attributes of the info object
+    """
+    info_class = type(info_object)
+    if info_class not in FORMATTING_ATTRIBUTES:
+        FORMATTING_ATTRIBUTES[info_class] = frozenset(
+            getattr(info_object, '_fields', None) or vars(info_object)
+        )
+    return FORMATTING_ATTRIBUTES[info_class]
+
+
+def format_other_formatting_string(fmt_string, info_object, info_attr, size_limit,
+                                   colour='white', value_fill=' '):
+    """Formats the token from the fmt_string, according to the values stored in info_object
 
     info_attr is one of the tokens from fmt_string, which is extracted from the info_object,
-    that stores the real value. This value is then output to stdout with colours, fills,
-    and is trimmed to the given size.
+    that stores the real value. This value is then coloured, filled and trimmed to the given
+    size.
 
     :param str fmt_string: formatting string for the given token
     :param object info_object: object with stored information (ProfileInfo or MinorVersion)
@@ -691,9 +821,10 @@ def print_other_formatting_string(fmt_string, info_object, info_attr, size_limit
     :param str info_attr: attribute we are looking up in the info_object
     :param str colour: default colour of the formatting token that will be printed out
     :param char value_fill: will fill the string with this
+    :return: coloured string of the token
     """
     # Check if encountered incorrect token in the formatting string
-    if not hasattr(info_object, info_attr):
+    if info_attr not in get_formatting_attributes(info_object):
         perun_log.error(
             "invalid formatting string '{}': object does not contain '{}' attribute".format(
                 fmt_string, info_attr
@@ -704,11 +835,10 @@ def print_other_formatting_string(fmt_string, info_object, info_attr, size_limit
     raw_value = getattr(info_object, info_attr)
     info_value = raw_value[:size_limit].ljust(size_limit, value_fill)
 
-    # Print the actual token
+    # Format the actual token
     if info_attr == 'type':
-        cprint("[{}]".format(info_value), PROFILE_TYPE_COLOURS[raw_value])
-    else:
-        cprint(info_value, colour)
+        return perun_log.in_color("[{}]".format(info_value), PROFILE_TYPE_COLOURS[raw_value])
+    return perun_log.in_color(info_value, colour)
 
 
 def calculate_maximal_lengths_for_stats(obj_list, stat_function, stat_header=""):
@@ -720,10 +850,11 @@ def calculate_maximal_lengths_for_stats(obj_list, stat_function, stat_header="")
     :return: dictionary of maximal lenghts for various stats
     """
     maxima = collections.defaultdict(int)
-    for obj in obj_list:
-        object_stats = stat_function(obj)
-        for key in object_stats.keys():
-            maxima[key] = max(len(stat_header), maxima[key], len(str(object_stats[key])))
+    stats_list = [stat_function(obj) for obj in obj_list]
+    for key in set().union(*stats_list):
+        maxima[key] = max(
+            [len(stat_header)] + [len(str(stats[key])) for stats in stats_list if key in stats]
+        )
     return maxima
 
 
@@ -734,13 +865,32 @@ def calculate_maximal_lengths_for_object_list(object_list, valid_attributes):
     :param list valid_attributes: list of valid attributes of objects from list
     :returns dict: dictionary with maximal lengths for profiles
     """
+    return calculate_maximal_lengths_for_object_lists([object_list], valid_attributes)
+
+
+def calculate_maximal_lengths_for_object_lists(object_lists, valid_attributes):
+    """For given object lists, will calculate the maximal sizes of their values for table view.
+
+    The maxima are computed over all of the lists at once, without concatenating them first.
+
+    :param list object_lists: lists of objects (e.g. ProfileInfo or MinorVersion) of same kind
+    :param list valid_attributes: list of valid attributes of objects from lists
+    :returns dict: dictionary with maximal lengths for profiles
+    """
     # Measure the maxima for the lengths of the object info
     max_lengths = collections.defaultdict(int)
-    for object_info in object_list:
-        for attr in valid_attributes:
-            if hasattr(object_info, attr):
-                max_lengths[attr] \
-                    = max(len(attr), max_lengths[attr], len(str(getattr(object_info, attr))))
+    object_lists = [object_list for object_list in object_lists if object_list]
+    if not object_lists:
+        return max_lengths
+    # The objects in the lists are of the same kind, hence the attributes are checked only once
+    present_attributes = [
+        attr for attr in valid_attributes if hasattr(object_lists[0][0], attr)
+    ]
+    for attr in present_attributes:
+        attr_getter = attrgetter(attr)
+        max_lengths[attr] = max(len(attr), *(
+            max(map(len, map(str, map(attr_getter, object_list)))) for object_list in object_lists
+        ))
     return max_lengths
 
 
@@ -785,19 +935,21 @@ def print_status_profile_list(profiles, max_lengths, short, list_type='tracked')
 
     # Load formating string for profile
     fmt_string = perun_config.lookup_key_recursively('format.status')
-    fmt_tokens = perun_log.scan_formatting_string(
-        fmt_string, {}, default_fmt_callback=lambda token: "%" + token + "%"
+    fmt_tokens = parse_formatting_string(fmt_string)
+    header_tokens = adjust_header_length(fmt_tokens, max_lengths, list_config)
+    separator = perun_log.in_color(
+        "\u2550" * list_config.header_width + "\u25A3", list_config.colour
     )
-    adjust_header_length(fmt_tokens, max_lengths, list_config)
 
     # Print header (2 is padding for id)
-    print_status_profile_list_header(fmt_tokens, list_config, max_lengths)
+    print_status_profile_list_header(header_tokens, list_config, separator)
 
     # Print profiles
-    print_status_profiles(fmt_tokens, list_config, max_lengths, fmt_string, profiles)
+    print_status_profiles(fmt_tokens, list_config, max_lengths, fmt_string, profiles, separator)
 
 
-def print_status_profiles(fmt_tokens, list_config, max_lengths, fmt_string, profiles):
+def print_status_profiles(fmt_tokens, list_config, max_lengths, fmt_string, profiles,
+                          separator):
     """Prints each of the profiles, formatted according to the formatting string
 
     The first profile, and every fifth profile is separated by horizontal line.
@@ -811,33 +963,44 @@ def print_status_profiles(fmt_tokens, list_config, max_lengths, fmt_string, prof
       5@p ┃ [mixed ] ┃ complexity-quicksort-[_]-[_]-2018-03-22-17-04-52.perf ┃
     ═════════════════════════════════════════════════════════════════════════▣
 
-    :param list fmt_tokens: list of pairs of (token type, token)
+    :param list fmt_tokens: list of parsed formatting tokens
     :param ProfileInfoConfig list_config: configuration of the output profile list
     :param dict max_lengths: mapping of token types ot their maximal lengths for alignment
     :param str fmt_string: formatting string for error handling
     :param list profiles: list of profiles
+    :param str separator: coloured horizontal line separating the profiles
     """
+    # The limits and the coloured raw strings are the same for each of the rows,
+    # hence they are computed only once
+    row_tokens = [
+        (token_type, token, adjust_limit(limit, token, max_lengths), fill)
+        if token_type == 'fmt_string'
+        else (token_type, perun_log.in_color(token, list_config.colour), limit, fill)
+        for (token_type, token, limit, fill) in fmt_tokens
+    ]
+    id_fmt = "{}@" + list_config.id_char
+    id_width = list_config.id_width + 2
     for profile_no, profile_info in enumerate(profiles):
-        perun_log.info(" ", end='')
-        cprint("{}@{}".format(profile_no, list_config.id_char).rjust(list_config.id_width + 2, ' '),
-               list_config.colour)
-        perun_log.info(" ", end='')
-        for (token_type, token) in fmt_tokens:
+        # Each row is first built from its tokens and then written to the output at once
+        row = [" ", perun_log.in_color(
+            id_fmt.format(profile_no).rjust(id_width, ' '), list_config.colour
+        ), " "]
+        for (token_type, token, limit, fill) in row_tokens:
             if token_type == 'fmt_string':
-                attr_type, limit, fill = FMT_REGEX.match(token).groups()
-                limit = adjust_limit(limit, attr_type, max_lengths)
-                print_other_formatting_string(
-                    fmt_string, profile_info, attr_type, limit,
+                row.append(format_other_formatting_string(
+                    fmt_string, profile_info, token, limit,
                     colour=list_config.colour, value_fill=fill or ' '
-                )
+                ))
             else:
-                cprint(token, list_config.colour)
-        perun_log.info("")
+                row.append(token)
+        row.append("\n")
         if profile_no % 5 == 0 or profile_no == list_config.list_len - 1:
-            cprintln("\u2550" * list_config.header_width + "\u25A3", list_config.colour)
+            row.append(separator)
+            row.append("\n")
+        sys.stdout.write("".join(row))
 
 
-def print_status_profile_list_header(fmt_tokens, list_config, max_lengths):
+def print_status_profile_list_header(header_tokens, list_config, separator):
     """Prints the header of the profile list, printing each token aligned by maximal lengths.
 
     The example of header is as follows:
@@ -846,55 +1009,64 @@ def print_status_profile_list_header(fmt_tokens, list_config, max_lengths):
       id  ┃   type   ┃                         source                        ┃
     ═════════════════════════════════════════════════════════════════════════▣
 
-    :param list fmt_tokens: list of pairs of (token type, token)
+    :param list header_tokens: list of parsed formatting tokens with limits adjusted for header
     :param ProfileInfoConfig list_config: configuration of the output profile list
-    :param dict max_lengths: mapping of token types ot their maximal lengths for alignment
+    :param str separator: coloured horizontal line separating the header
     """
-    cprintln("\u2550" * list_config.header_width + "\u25A3", list_config.colour)
-    perun_log.info(" ", end='')
-    cprint("id".center(list_config.id_width + 2, ' '), list_config.colour)
-    perun_log.info(" ", end='')
-    for (token_type, token) in fmt_tokens:
+    header = [separator, "\n", " ", perun_log.in_color(
+        "id".center(list_config.id_width + 2, ' '), list_config.colour
+    ), " "]
+    for (token_type, token, limit, _) in header_tokens:
         if token_type == 'fmt_string':
-            attr_type, limit, _ = FMT_REGEX.match(token).groups()
-            limit = adjust_limit(limit, attr_type, max_lengths, (2 if attr_type == 'type' else 0))
-            token_string = attr_type.center(limit, ' ')
-            cprint(token_string, list_config.colour)
+            token_string = token.center(limit, ' ')
+            header.append(perun_log.in_color(token_string, list_config.colour))
         else:
             # Print the rest (non token stuff)
-            cprint(token, list_config.colour)
-    perun_log.info("")
-    cprintln("\u2550" * list_config.header_width + "\u25A3", list_config.colour)
+            header.append(perun_log.in_color(token, list_config.colour))
+    header.extend(["\n", separator, "\n"])
+    sys.stdout.write("".join(header))
 
 
 def adjust_header_length(fmt_tokens, max_lengths, list_config):
     """Ajdust the length of the header stored in configuration
 
-    :param list fmt_tokens: list of tokens
+    The limits of the formatting tokens are adjusted only once, and the resulting tokens are
+    returned, so the header can be printed without adjusting them again.
+
+    :param list fmt_tokens: list of parsed formatting tokens
     :param dict max_lengths: maximal lengths of individual tokens
     :param ProfileListConfig list_config: configuration of the printed list
+    :return: list of parsed formatting tokens with limits adjusted for header
     """
     # the magic constant three is for 3 border columns
-    for (token_type, token) in fmt_tokens:
+    header_tokens = []
+    for (token_type, token, limit, fill) in fmt_tokens:
         if token_type == 'fmt_string':
-            attr_type, limit, _ = FMT_REGEX.match(token).groups()
-            limit = adjust_limit(limit, attr_type, max_lengths, (2 if attr_type == 'type' else 0))
+            limit = adjust_limit(limit, token, max_lengths, (2 if token == 'type' else 0))
             list_config.header_width += limit
         else:
             list_config.header_width += len(token)
+        header_tokens.append((token_type, token, limit, fill))
+    return header_tokens
 
 
 def get_untracked_profiles():
     """Returns list untracked profiles, currently residing in the .perun/jobs directory.
 
+    The profiles are not sorted, use :func:`perun.profile.helpers.sort_profiles` if the order
+    matters.
+
     :returns list: list of ProfileInfo parsed from .perun/jobs directory
     """
     saved_entries = []
     profile_list = []
     # First load untracked files from the ./jobs/ directory
-    untracked_list = sorted(
-        list(filter(lambda f: f.endswith('perf'), os.listdir(pcs.get_job_directory())))
-    )
+    # The directory entries are kept, so their stats are obtained without the path lookups;
+    # the entries are not sorted, since the callers sort the profiles themselves
+    with os.scandir(pcs.get_job_directory()) as job_entries:
+        untracked_entries = {
+            entry.name: entry for entry in job_entries if entry.name.endswith('perf')
+        }
 
     # Second load registered files in job index
     job_index = pcs.get_job_index()
@@ -906,8 +1078,8 @@ def get_untracked_profiles():
     # In case it is still valid, we extract it into ProfileInfo and remove it from the list
     #   of files in ./jobs directory
     for index_entry in pending_index_entries:
-        if index_entry.path in untracked_list:
-            real_path = os.path.join(pcs.get_job_directory(), index_entry.path)
+        if index_entry.path in untracked_entries:
+            real_path = untracked_entries.pop(index_entry.path).path
             index_info = {
                 'header': {
                     'type': index_entry.type,
@@ -925,13 +1097,12 @@ def get_untracked_profiles():
             )
             profile_list.append(profile_info)
             saved_entries.append(index_entry)
-            untracked_list.remove(index_entry.path)
 
     # Now for every non-registered file in the ./jobs/ directory, we load the profile,
     #   extract the info and register it in the index
-    for untracked_path in untracked_list:
-        real_path = os.path.join(pcs.get_job_directory(), untracked_path)
-        time = timestamp.timestamp_to_str(os.stat(real_path).st_mtime)
+    for untracked_path, dir_entry in untracked_entries.items():
+        real_path = dir_entry.path
+        time = timestamp.timestamp_to_str(dir_entry.stat().st_mtime)
 
         # Load the data from JSON, which contains additional information about profile
         loaded_profile = store.load_profile_from_file(real_path, is_raw_profile=True)
@@ -983,8 +1154,9 @@ def status(short=False, **_):
     # Print profiles
     minor_version_profiles = profile.load_list_for_minor_version(minor_head)
     untracked_profiles = get_untracked_profiles()
-    maxs = calculate_maximal_lengths_for_object_list(
-        minor_version_profiles + untracked_profiles, profile.ProfileInfo.valid_attributes
+    # The maximal lengths are needed only for printing the profile lists in the long format
+    maxs = {} if short else calculate_maximal_lengths_for_object_lists(
+        [minor_version_profiles, untracked_profiles], profile.ProfileInfo.valid_attributes
     )
     print_status_profile_list(minor_version_profiles, maxs, short)
     if not short:
@@ -1011,21 +1183,22 @@ def load_profile_from_args(profile_name, minor_version):
     :returns dict: loaded profile represented as dictionary
     """
     profiled_looked_up_already = store.is_sha1(profile_name)
-    profiles = [profile_name] if profiled_looked_up_already else []
+    chosen_profile = profile_name if profiled_looked_up_already else None
     # If the profile is defined by its path, we have to first look up it in the index
     if not profiled_looked_up_already:
         _, minor_index_file = store.split_object_name(pcs.get_object_directory(), minor_version)
         # If there is nothing at all in the index, since it is not even created ;)
-        #   we returning nothing otherwise we lookup entries in index
+        #   we returning nothing otherwise we lookup the first matching entry in index
         if os.path.exists(minor_index_file):
-            with open(minor_index_file, 'rb') as minor_handle:
-                lookup_pred = lambda entry: entry.path == profile_name
-                profiles.extend(index.lookup_all_entries_within_index(minor_handle, lookup_pred))
+            with open(minor_index_file, 'rb') as minor_handle, \
+                    helpers.SuppressedExceptions(EntryNotFoundException):
+                chosen_profile = index.lookup_entry_within_index(
+                    minor_handle, lambda entry: entry.path == profile_name, profile_name
+                )
 
-    # If there are more profiles we should chose
-    if not profiles:
+    # If there are more profiles we chose the first one
+    if chosen_profile is None:
         return None
-    chosen_profile = profiles[0]
 
     # Peek the type if the profile is correct and load the json
     _, profile_name = store.split_object_name(pcs.get_object_directory(), chosen_profile.checksum)
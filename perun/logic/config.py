@@ -81,7 +81,7 @@ class Config:
         # Remove the key from the caching
         # ! Note that this is mainly used for the testing, but might be triggered during the future
         # as well.
-        decorators.remove_from_function_args_cache('lookup_key_recursively')
+        decorators.remove_from_function_args_cache('lookup_cached_key_recursively')
         decorators.remove_from_function_args_cache('gather_key_recursively')
 
         *sections, last_section = key.split('.')
@@ -143,6 +143,7 @@ def write_config_to(path, config_data):
     perun_log.msg_to_stdout("Writing config '{}' at {}".format(
         config_data, path
     ), 2)
+    decorators.remove_from_function_args_cache('lookup_cached_key_recursively')
     with open(path, 'w') as yaml_file:
         YAML().dump(config_data, yaml_file)
 
@@ -408,6 +409,20 @@ def lookup_key_recursively(key, default=None):
     :param str key: key we are looking up
     :param str default: default value, if key is not located in the hierarchy
     """
+    return lookup_cached_key_recursively(key, default, os.getcwd())
+
+
+@decorators.singleton_with_args
+def lookup_cached_key_recursively(key, default, _):
+    """Recursively looks up the key in the hierarchy, which is done once per run and location
+
+    Every lookup has to locate the perun instance first, hence the looked up values are cached.
+    The cache is cleared whenever any config is set or written.
+
+    :param str key: key we are looking up
+    :param str default: default value, if key is not located in the hierarchy
+    :param str _: working directory, the perun instance is located from (used as key of the cache)
+    """
     for config_instance in get_hierarchy():
         try:
             return config_instance.get(key)
@@ -4,6 +4,7 @@ This contains both helper constants, enums, and function, and most of all all de
 of various version of index entries.
 """
 
+import io
 import os
 import binascii
 import struct
@@ -15,6 +16,7 @@ from enum import Enum
 import perun.utils.timestamps as timestamps
 import perun.utils.log as perun_log
 import perun.utils.helpers as helpers
+import perun.utils.decorators as decorators
 import perun.logic.store as store
 import perun.logic.pcs as pcs
 
@@ -397,6 +399,8 @@ def write_entry_to_index(index_file, file_entry):
     :param str index_file: path to the index file
     :param BasicIndexEntry file_entry: index entry that will be written to the file
     """
+    # The profiles listed from the modified index are outdated
+    decorators.remove_from_function_args_cache('load_cached_list_for_minor_version')
     with open(index_file, 'rb+') as index_handle:
         # Lookup the position of the registered file within the index
         if file_entry.offset == -1:
@@ -451,6 +455,8 @@ def write_list_of_entries(index_file, entry_list):
     :param str index_file:
     :param list of ExtendedIndexEntry entry_list:
     """
+    # The profiles listed from the modified index are outdated
+    decorators.remove_from_function_args_cache('load_cached_list_for_minor_version')
     # First delete the index
     with open(index_file, 'wb+') as index_handle:
         index_handle.truncate(0)
@@ -571,6 +577,8 @@ def remove_from_index(base_dir, minor_version, removed_file_generator):
     # Get directory and index
     _, minor_version_index = store.split_object_name(base_dir, minor_version)
     removed_profile_number = len(removed_file_generator)
+    # The profiles listed from the modified index are outdated
+    decorators.remove_from_function_args_cache('load_cached_list_for_minor_version')
 
     if not os.path.exists(minor_version_index):
         raise EntryNotFoundException("", "empty index")
@@ -649,24 +657,56 @@ def get_profile_number_for_minor(base_dir, minor_version):
     _, minor_index_file = store.split_object_name(base_dir, minor_version)
 
     if os.path.exists(minor_index_file):
-        profile_numbers_per_type = {
-            profile_type: 0 for profile_type in helpers.SUPPORTED_PROFILE_TYPES
-            }
-
         with open(minor_index_file, 'rb') as index_handle:
-            # Read the overall
-            index_handle.seek(INDEX_NUMBER_OF_ENTRIES_OFFSET)
-            profile_numbers_per_type['all'] = store.read_int_from_handle(index_handle)
-
-            # Check the types of the entry
-            for entry in walk_index(index_handle):
-                if entry.type in helpers.SUPPORTED_PROFILE_TYPES:
-                    profile_numbers_per_type[entry.type] += 1
-            return profile_numbers_per_type
+            return get_profile_number_from_handle(index_handle)
     else:
         return {'all': 0}
 
 
+def get_profile_numbers_for_minors(base_dir, minor_versions):
+    """Computes the numbers of profiles for each of the given minor versions at once
+
+    Contrary to :func:`get_profile_number_for_minor`, each index is read from the filesystem in
+    one chunk and its entries are then parsed from the memory. This saves the repeated seeks and
+    small reads, which add up when walking through longer histories (e.g. in ``perun log``).
+
+    :param str base_dir: base directory of the profiles
+    :param iterable minor_versions: representations of minor versions
+    :returns dict: mapping of minor versions to dictionaries of numbers of profiles of types
+    """
+    profile_numbers = {}
+    for minor_version in minor_versions:
+        _, minor_index_file = store.split_object_name(base_dir, minor_version)
+        try:
+            with open(minor_index_file, 'rb') as index_handle:
+                index_content = index_handle.read()
+        except FileNotFoundError:
+            profile_numbers[minor_version] = {'all': 0}
+            continue
+        profile_numbers[minor_version] = get_profile_number_from_handle(io.BytesIO(index_content))
+    return profile_numbers
+
+
+def get_profile_number_from_handle(index_handle):
+    """
+    :param file index_handle: opened handle of the minor version index
+    :returns dict: dictionary of number of profiles inside the index of the minor_version of types
+    """
+    profile_numbers_per_type = {
+        profile_type: 0 for profile_type in helpers.SUPPORTED_PROFILE_TYPES
+    }
+
+    # Read the overall
+    index_handle.seek(INDEX_NUMBER_OF_ENTRIES_OFFSET)
+    profile_numbers_per_type['all'] = store.read_int_from_handle(index_handle)
+
+    # Check the types of the entry
+    for entry in walk_index(index_handle):
+        if entry.type in helpers.SUPPORTED_PROFILE_TYPES:
+            profile_numbers_per_type[entry.type] += 1
+    return profile_numbers_per_type
+
+
 def load_custom_index(index_path):
     """Loads the content of a custom index file (e.g. temp or stats) as a dictionary.
 
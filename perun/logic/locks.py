@@ -22,17 +22,26 @@ their resources against each other.
 """
 
 import os
+import re
+import sys
 from enum import Enum
 
 from perun.collect.trace.watchdog import WATCH_DOG
-from perun.collect.trace.values import LOCK_SUFFIX_LEN, PS_FORMAT
+from perun.collect.trace.values import PS_FORMAT
 
 import perun.logic.temp as temp
 import perun.utils as utils
-from perun.utils.helpers import SuppressedExceptions
 from perun.utils.exceptions import ResourceLockedException, InvalidTempPathException
 
 
+# Regex for parsing the lock file name <resource name>:<pid><suffix>
+LOCK_FILE_REGEX = re.compile(r"(.+):([0-9]+)(\.[a-z]_lock)")
+# Regex for parsing the pid and command from the 'ps' output in PS_FORMAT (pid,ppid,pgid,cmd)
+PS_PROCESS_REGEX = re.compile(r"\s*([0-9]+)\s+\S+\s+\S+(.*)")
+# Regex for checking that the command contains 'perun' as a separate token
+PERUN_COMMAND_REGEX = re.compile(r"(?:^|\s)perun(?:\s|$)")
+
+
 class LockType(Enum):
     """ Specifies different lock types that are used in the trace collector.
 
@@ -50,9 +59,13 @@ class LockType(Enum):
         :param str suffix: the suffix to transform
         :return LockType or None: corresponding LockType or None if the suffix has none
         """
-        for resource in cls:
-            if resource.value == suffix:
-                return resource
+        return _SUFFIX_MAP.get(suffix)
+
+
+# Mapping of lock file suffixes to the LockType items, built once for the lookups of lock files
+_SUFFIX_MAP = {resource.value: resource for resource in LockType}
+# Suffixes of all the lock files, used for filtering the lock files in the locks directory
+LOCK_SUFFIXES = tuple(_SUFFIX_MAP.keys())
 
 
 class ResourceLock:
@@ -88,14 +101,14 @@ class ResourceLock:
         :param str lock_file: the path of the lock file
         :return ResourceLock or None: the lock object or None if the file does not represent a lock
         """
-        with SuppressedExceptions(ValueError):
-            # Get the resource name and pid
-            name, rest = os.path.basename(lock_file).rsplit(':', maxsplit=1)
-            pid = int(rest[:-LOCK_SUFFIX_LEN])
+        # Get the resource name, pid and suffix, files not representing a lock do not match
+        lock_match = LOCK_FILE_REGEX.fullmatch(os.path.basename(lock_file))
+        if lock_match:
+            name, pid, suffix = lock_match.groups()
             # Transform the suffix into a LockResourceType
-            resource_type = LockType.suffix_to_type(rest[-LOCK_SUFFIX_LEN:])
+            resource_type = LockType.suffix_to_type(suffix)
             if resource_type:
-                return cls(resource_type, name, pid, os.path.dirname(lock_file))
+                return cls(resource_type, name, int(pid), os.path.dirname(lock_file))
 
     def lock(self):
         """ Actually locks the resource represented by the lock object.
@@ -127,14 +140,23 @@ class ResourceLock:
         WATCH_DOG.debug("Checking lock validity for a resource '{}' with pid '{}'"
                         .format(self.name, self.pid))
 
-        # Iterate all the lock files related to the resource + resource type
-        for active_lock in get_active_locks_for(self.locks_dir, [self.name], [self.type]):
-            # Ignore the self lock file
-            if active_lock.pid == self.pid:
-                continue
-
+        # Obtain all the lock files related to the resource + resource type, except the self lock
+        colliding_locks = [
+            active_lock for active_lock
+            in get_active_locks_for(self.locks_dir, [self.name], [self.type])
+            if active_lock.pid != self.pid
+        ]
+        if not colliding_locks:
+            WATCH_DOG.debug("Lock for '{}:{}' is valid".format(self.name, self.pid))
+            return
+
+        # Query all the colliding processes at once
+        running_perun_processes = _are_running_perun_processes(
+            [active_lock.pid for active_lock in colliding_locks]
+        )
+        for active_lock in colliding_locks:
             # Check if the resource is actually locked by a running perun process
-            if _is_running_perun_process(active_lock.pid):
+            if running_perun_processes[active_lock.pid]:
                 WATCH_DOG.debug("Resource '{}' already locked by a process '{}'"
                                 .format(self.name, active_lock.pid))
                 raise ResourceLockedException(self.name, active_lock.pid)
@@ -188,13 +210,36 @@ def get_active_locks_for(locks_dir, names=None, resource_types=None, pids=None):
                 (pids is None or lock_pid in pids) and
                 (resource_types is None or r_type in resource_types))
 
+    # Store the lock objects of valid and matching locks
+    return [
+        lock for lock in _scan_locks(locks_dir) if is_matching(lock.name, lock.type, lock.pid)
+    ]
+
+
+def _scan_locks(locks_dir):
+    """ Lists all the locks in the locks_dir, i.e. the lock files parsed into ResourceLock objects.
+
+    The locks are written by other perun processes as well, hence the directory is always
+    listed anew.
+
+    :param str locks_dir: the directory where to look for the lock files
+
+    :return list: the list of ResourceLock objects
+    """
+    locks_path = temp.temp_path(locks_dir)
+    if not os.path.isdir(locks_path):
+        raise InvalidTempPathException("The 'tmp' path '{}' does not exist.".format(locks_path))
+
     locks = []
-    for lock_file in temp.list_all_temps(locks_dir):
-        # Get a ResourceLock object from the lock file
-        lock = ResourceLock.fromfile(lock_file)
-        if lock is not None and is_matching(lock.name, lock.type, lock.pid):
-            # Store the lock object ff it is valid and matching lock
-            locks.append(lock)
+    with os.scandir(locks_path) as lock_entries:
+        for lock_entry in lock_entries:
+            # Skip the files that cannot represent a lock without parsing them
+            if not lock_entry.name.endswith(LOCK_SUFFIXES) or not lock_entry.is_file():
+                continue
+            # Get a ResourceLock object from the lock file
+            lock = ResourceLock.fromfile(lock_entry.path)
+            if lock is not None:
+                locks.append(lock)
     return locks
 
 
@@ -205,14 +250,63 @@ def _is_running_perun_process(pid):
 
     :return bool: true if the PID belongs to a running perun process, false otherwise
     """
-    # Request information about process with the given PID
-    WATCH_DOG.debug("Checking the details of a process '{}'".format(pid))
-    query = 'ps -o {} -p {}'.format(PS_FORMAT, pid)
+    return _are_running_perun_processes([pid])[pid]
+
+
+def _are_running_perun_processes(pids):
+    """ Checks which of the given PIDs represent a currently running perun process.
+
+    On Linux, the command lines of the processes are read directly from the /proc filesystem.
+    Otherwise (or if the /proc entries cannot be read), all of the remaining processes are
+    queried by a single 'ps' call.
+
+    :param list pids: the PIDs of the processes
+
+    :return dict: mapping of PIDs to true if the PID belongs to a running perun process
+    """
+    running = {}
+    queried_pids = pids
+    if sys.platform.startswith('linux'):
+        queried_pids = []
+        for pid in pids:
+            try:
+                running[pid] = _is_perun_command_in_proc(pid)
+            except FileNotFoundError:
+                # No such process exists
+                running[pid] = False
+            except OSError:
+                queried_pids.append(pid)
+        if not queried_pids:
+            return running
+
+    # Request information about processes with the given PIDs
+    WATCH_DOG.debug("Checking the details of processes '{}'".format(queried_pids))
+    query = 'ps -o {} -p {}'.format(PS_FORMAT, ','.join(map(str, queried_pids)))
     result = utils.run_safely_external_command(query, False)[0].decode('utf-8').splitlines()
-    WATCH_DOG.log_variable('process::{}'.format(pid), result)
-    # If no such process exists then the output contains only header line
-    if len(result) < 2:
-        return False
-    # Otherwise take the CMD record in the second line and test if it is related to perun
-    command = result[1].strip().split()[3:]
-    return 'perun' in command
+    WATCH_DOG.log_variable('process::{}'.format(','.join(map(str, queried_pids))), result)
+    # Processes that do not exist are not listed, hence they are not running perun processes
+    running.update(dict.fromkeys(queried_pids, False))
+    # Skip the header line and test if the CMD record of each process is related to perun
+    for process in result[1:]:
+        process_match = PS_PROCESS_REGEX.match(process)
+        if process_match:
+            pid, command = process_match.groups()
+            running[int(pid)] = PERUN_COMMAND_REGEX.search(command) is not None
+    return running
+
+
+def _is_perun_command_in_proc(pid):
+    """ Checks if the command line of the given PID, as stored in /proc, is related to perun.
+
+    The arguments of the command line are separated by null bytes, which are treated as
+    whitespaces, so the command is checked the same way as in the output of 'ps'.
+
+    :param int pid: the PID of the process
+
+    :return bool: true if the PID belongs to a perun process, false otherwise
+    """
+    WATCH_DOG.debug("Checking the details of a process '{}'".format(pid))
+    with open('/proc/{}/cmdline'.format(pid), 'rb') as cmdline_handle:
+        command = cmdline_handle.read().replace(b'\0', b' ').decode('utf-8', 'ignore')
+    WATCH_DOG.log_variable('process::{}'.format(pid), command)
+    return PERUN_COMMAND_REGEX.search(command) is not None
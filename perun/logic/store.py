@@ -71,6 +71,25 @@ def pack_content(content):
     return zlib.compress(content)
 
 
+def pack_and_hash(chunks):
+    """Computes the checksum and packs the content given by chunks in a single pass
+
+    The result is the same as calling :func:`compute_checksum` and :func:`pack_content` on the
+    concatenation of the chunks, however the chunks are neither concatenated nor iterated twice.
+
+    :param iterable chunks: iterable of bytes forming the content
+    :returns tuple: (40-character SHA-1 checksum of the content, packed content)
+    """
+    checksum = hashlib.sha1()
+    compressor = zlib.compressobj()
+    packed_parts = []
+    for chunk in chunks:
+        checksum.update(chunk)
+        packed_parts.append(compressor.compress(chunk))
+    packed_parts.append(compressor.flush())
+    return checksum.hexdigest(), b"".join(packed_parts)
+
+
 def read_and_deflate_chunk(file_handle):
     """
     :param file file_handle: opened file handle
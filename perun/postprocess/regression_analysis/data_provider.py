@@ -1,5 +1,6 @@
 """Module for various means of regression data acquisition. """
 
+from itertools import groupby
 from operator import itemgetter
 
 import perun.profile.convert as convert
@@ -16,15 +17,6 @@ def data_provider_mapper(profile, **kwargs):
     return _PROFILE_MAPPER.get(profile_type, generic_profile_provider)(profile, **kwargs)
 
 
-def resource_sort_key(resource):
-    """Extracts the key from resource used for sorting
-
-    :param dict resource: profiling resource
-    :return: key used for sorting
-    """
-    return convert.flatten(resource['uid'])
-
-
 def generic_profile_provider(profile, of_key, per_key, **_):
     """Data provider for trace collector profiling output.
 
@@ -35,29 +27,19 @@ def generic_profile_provider(profile, of_key, per_key, **_):
     :returns generator: each subsequent call returns tuple: x points list, y points list, function
         name
     """
-    # Get the file resources contents
-    resources = list(map(itemgetter(1), profile.all_resources()))
-
-    # Sort the dictionaries by function name for easier traversing
-    resources = sorted(resources, key=resource_sort_key)
-    x_points_list = []
-    y_points_list = []
-    function_name = convert.flatten(resources[0]['uid'])
-    # Store all the points until the function name changes
-    for resource in resources:
-        if convert.flatten(resource['uid']) != function_name:
-            if x_points_list:
-                # Function name changed, yield the list of data points
-                yield x_points_list, y_points_list, function_name
-                x_points_list = [resource[per_key]]
-                y_points_list = [resource[of_key]]
-                function_name = convert.flatten(resource['uid'])
-        else:
-            # Add the data points
+    # Get the file resources contents, flatten their function names only once and sort them
+    # by the function names for easier traversing
+    resources = sorted(
+        ((convert.flatten(resource['uid']), resource) for _, resource in profile.all_resources()),
+        key=itemgetter(0)
+    )
+    # Yield all the points of each function at once
+    for function_name, function_resources in groupby(resources, key=itemgetter(0)):
+        x_points_list = []
+        y_points_list = []
+        for _, resource in function_resources:
             x_points_list.append(resource[per_key])
             y_points_list.append(resource[of_key])
-    # End of resources, yield the current lists
-    if x_points_list:
         yield x_points_list, y_points_list, function_name
 
 # profile types : data provider functions mapping dictionary
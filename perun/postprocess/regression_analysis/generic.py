@@ -14,6 +14,9 @@ the given argument and return value conventions.
 """
 
 from math import sqrt
+
+import numpy as np
+
 import perun.postprocess.regression_analysis.tools as tools
 
 
@@ -51,7 +54,7 @@ def generic_regression_data(x_pts, y_pts, f_x, f_y, steps, **_):
     values and the number of points.
 
     'f_x' and 'f_y' refer to the x and y values modification for the sums (e.g. log10 for x values
-    => sum of log10(x) values).
+    => sum of log10(x) values). The functions are applied to the whole numpy arrays of points.
 
     The 'steps' allows to split the points sequence into parts (for iterative computation),
     where each part continues the computation (the part contains results from the previous).
@@ -74,31 +77,34 @@ def generic_regression_data(x_pts, y_pts, f_x, f_y, steps, **_):
     # We also need the min and max values
     x_min = x_pts[0]
     x_max = x_pts[0]
+    x_array = np.asarray(x_pts, dtype=float)
+    y_array = np.asarray(y_pts, dtype=float)
 
     # Compute the sums of x, y, x^2, y^2 and x*y
     x_sum, y_sum, x_square_sum, y_square_sum, xy_sum = 0.0, 0.0, 0.0, 0.0, 0.0
     # Split the computation into specified steps
     for part_start, part_end in tools.split_sequence(len(x_pts), steps):
-        skipped = 0
-        for x_pt, y_pt in zip(x_pts[part_start:part_end], y_pts[part_start:part_end]):
-
-            # Account for possible domain errors with f_x and f_y functions, simply skip the point
-            try:
-                x_tmp = f_x(x_pt)
-                y_tmp = f_y(y_pt)
-            except ValueError:
-                skipped += 1
-                continue
-
-            # Compute the intermediate results
-            x_sum += x_tmp
-            y_sum += y_tmp
-            x_square_sum += x_tmp ** 2
-            y_square_sum += y_tmp ** 2
-            xy_sum += x_tmp * y_tmp
-
-            # Check the min and max
-            x_min, x_max = min(x_min, x_pt), max(x_max, x_pt)
+        # Account for possible domain errors with f_x and f_y functions, simply skip the point
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_tmp = f_x(x_array[part_start:part_end])
+            y_tmp = f_y(y_array[part_start:part_end])
+        valid = np.isfinite(x_tmp) & np.isfinite(y_tmp)
+        x_tmp, y_tmp = x_tmp[valid], y_tmp[valid]
+        skipped = len(valid) - len(x_tmp)
+
+        # Compute the intermediate results
+        x_sum += float(np.sum(x_tmp))
+        y_sum += float(np.sum(y_tmp))
+        x_square_sum += float(np.dot(x_tmp, x_tmp))
+        y_square_sum += float(np.dot(y_tmp, y_tmp))
+        xy_sum += float(np.dot(x_tmp, y_tmp))
+
+        # Check the min and max, which are taken from the original values
+        valid_idx = np.flatnonzero(valid) + part_start
+        if valid_idx.size:
+            valid_x_pts = x_array[valid_idx]
+            x_min = min(x_min, x_pts[valid_idx[np.argmin(valid_x_pts)]])
+            x_max = max(x_max, x_pts[valid_idx[np.argmax(valid_x_pts)]])
 
         # Computation step is complete, save the data
         pts_num = part_end - skipped
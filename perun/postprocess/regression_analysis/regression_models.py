@@ -8,6 +8,8 @@ the sections of _MODELS dictionary representing the model properties.
 
 import math
 
+import numpy as np
+
 import perun.postprocess.regression_analysis.generic as generic
 import perun.postprocess.regression_analysis.specific as specific
 import perun.postprocess.regression_analysis.derived as derived
@@ -149,8 +151,8 @@ def filter_derived(regression_models_keys):
 # The record can also contain optional parameters as needed.
 # Keys description:
 # - model: full name of the regression model
-# - f_x: function that modifies x values in model computation according to formulae
-# - f_y: function that modifies y values in model computation according to formulae
+# - f_x: function that modifies x values (numpy array) in model computation according to formulae
+# - f_y: function that modifies y values (numpy array) in model computation according to formulae
 # - f_a: function that modifies b0 (a) coefficient in model computation according to formulae
 # - f_b: function that modifies b1 (b) coefficient in model computation according to formulae
 # - data_gen: function that generates intermediate values from points for model computation
@@ -204,7 +206,7 @@ _MODELS = {
     },
     'logarithmic': {
         'model': 'logarithmic',
-        'f_x': math.log,
+        'f_x': np.log,
         'f_y': lambda y: y,
         'f_a': lambda a: a,
         'f_b': lambda b: b,
@@ -244,8 +246,8 @@ _MODELS = {
     },
     'power': {
         'model': 'power',
-        'f_x': math.log10,
-        'f_y': math.log10,
+        'f_x': np.log10,
+        'f_y': np.log10,
         'f_a': lambda a: 10 ** a,
         'f_b': lambda b: b,
         'data_gen': generic.generic_regression_data,
@@ -266,7 +268,7 @@ _MODELS = {
     'exponential': {
         'model': 'exponential',
         'f_x': lambda x: x,
-        'f_y': math.log10,
+        'f_y': np.log10,
         'f_a': lambda a: 10 ** a,
         'f_b': lambda b: 10 ** b,
         'data_gen': generic.generic_regression_data,
@@ -28,6 +28,7 @@ import perun.vcs as vcs
 import perun.profile.query as query
 import perun.utils.log as perun_log
 import perun.utils.helpers as helpers
+import perun.utils.decorators as decorators
 
 from perun.utils import get_module
 from perun.profile.factory import Profile
@@ -167,11 +168,29 @@ def generate_profile_name(profile):
 def load_list_for_minor_version(minor_version):
     """Returns profiles assigned to the given minor version.
 
+    The index of the minor version is parsed only once per run (until it is modified), the
+    returned list is however a fresh copy, so the callers can e.g. sort it.
+
+    :param str minor_version: identification of the commit (preferably sha1)
+    :returns list: list of ProfileInfo parsed from index of the given minor_version
+    """
+    return list(load_cached_list_for_minor_version(
+        pcs.get_object_directory(), minor_version, os.getcwd()
+    ))
+
+
+@decorators.singleton_with_args
+def load_cached_list_for_minor_version(object_directory, minor_version, _):
+    """Returns profiles assigned to the given minor version, which are parsed once per run
+
+    The cache is cleared by the :mod:`perun.logic.index`, whenever some index is modified.
+
+    :param str object_directory: directory of the perun objects (used as key of the cache)
     :param str minor_version: identification of the commit (preferably sha1)
+    :param str _: working directory, the real paths are relative to (used as key of the cache)
     :returns list: list of ProfileInfo parsed from index of the given minor_version
     """
-    # Compute the
-    profiles = index.get_profile_list_for_minor(pcs.get_object_directory(), minor_version)
+    profiles = index.get_profile_list_for_minor(object_directory, minor_version)
     profile_info_list = []
     for index_entry in profiles:
         inside_info = {
@@ -186,7 +205,7 @@ def load_list_for_minor_version(minor_version):
                 {'name': p} for p in index_entry.postprocessors
             ]
         }
-        _, profile_name = store.split_object_name(pcs.get_object_directory(), index_entry.checksum)
+        _, profile_name = store.split_object_name(object_directory, index_entry.checksum)
         profile_info \
             = ProfileInfo(index_entry.path, profile_name, index_entry.time, inside_info)
         profile_info_list.append(profile_info)
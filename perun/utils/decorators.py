@@ -60,9 +60,10 @@ def arguments_to_key(func, *args, **kwargs):
         updated_defaults[:number_of_updated_keyword_args] = args[-number_of_updated_keyword_args:]
     keywords = f_args[-len(f_defaults):]
 
-    # update the defaults with new values
-    real_kwargs = f_kwonlydefaults.update(kwargs) if f_kwonlydefaults is not None else kwargs
-    real_kwargs.update(zip(keywords, updated_defaults))
+    # update the defaults with new values (explicitly passed keywords have the priority)
+    real_kwargs = dict(zip(keywords, updated_defaults))
+    real_kwargs.update(f_kwonlydefaults or {})
+    real_kwargs.update(kwargs)
 
     # get the
     real_posargs = args[:len(f_args)-len(f_defaults)]
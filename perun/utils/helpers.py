@@ -398,8 +398,13 @@ def locate_perun_dir_on(path):
     lookup_paths = path_to_subpaths(path)[::-1]
 
     for tested_path in lookup_paths:
-        if os.path.isdir(tested_path) and '.perun' in os.listdir(tested_path):
-            return tested_path
+        # scandir stops at the first match and knows the type of the entries without further stat
+        try:
+            with os.scandir(tested_path) as entries:
+                if any(entry.name == '.perun' and entry.is_dir() for entry in entries):
+                    return tested_path
+        except (FileNotFoundError, NotADirectoryError):
+            continue
     raise NotPerunRepositoryException(path)
 
 
@@ -15,7 +15,7 @@ import numpy as np
 
 import termcolor
 
-from perun.utils.helpers import first_index_of_attr, str_to_plural, identity
+from perun.utils.helpers import first_index_of_attr, str_to_plural
 from perun.utils.decorators import static_variables
 from perun.utils.helpers import COLLECT_PHASE_ATTRS, CHANGE_COLOURS, CHANGE_STRINGS, \
     DEGRADATION_ICON, OPTIMIZATION_ICON, CHANGE_CMD_COLOUR, CHANGE_TYPE_COLOURS
@@ -33,6 +33,13 @@ VERBOSE_RELEASE = 0
 SUPPRESS_WARNINGS = False
 SUPPRESS_PAGING = True
 
+# Mapping of names of the additional styles to the attributes of the coloured output
+ATTRIBUTE_STYLES = {
+    "none": [],
+    "bold": ["bold"],
+    "underline": ["underline"]
+}
+
 # set the logging for the perun
 logging.basicConfig(filename='perun.log', level=logging.DEBUG)
 
@@ -308,16 +315,9 @@ def in_color(output, color='white', attribute_style="none"):
 
     :return str: the new colored output (if enabled)
     """
-    attrs = {
-        "none": [],
-        "bold": ["bold"],
-        "underline": ["underline"]
-    }.get(attribute_style, [])
-
-    if COLOR_OUTPUT:
-        return termcolor.colored(output, color, attrs=attrs)
-    else:
+    if not COLOR_OUTPUT:
         return output
+    return termcolor.colored(output, color, attrs=ATTRIBUTE_STYLES.get(attribute_style, []))
 
 
 def count_degradations_per_group(degradation_list):
@@ -635,42 +635,6 @@ def print_elapsed_time(func):
     return inner_wrapper
 
 
-def scan_formatting_string(fmt, callbacks, callback=identity, default_fmt_callback=None, sep="%"):
-    """Scans the string, parses delimited formatting tokens and transforms them w.r.t callbacks
-
-    :param string fmt: formatting string
-    :param dict callbacks: list of callbacks to each formatting token, in case there is no default,
-        then error is raised.
-    :param func callback: callback function for non formatting string tokens
-    :param func default_fmt_callback: default callback called for tokens not found in the callbacks
-    :param char sep: delimiter for the tokens
-    :return: list of transformed tokens
-    """
-    i = 0
-    tokens = []
-    current_token = ""
-    for character in fmt:
-        if character == sep:
-            # found start or end of the token
-            i += 1
-            if i % 2 == 0:
-                # token is formatting string
-                tokens.append(("fmt_string", default_fmt_callback(current_token)))
-            else:
-                # token is raw string
-                tokens.append(("raw_string", callback(current_token)))
-            current_token = ""
-        else:
-            current_token += character
-
-    # Add what is rest
-    if current_token:
-        tokens.append(("raw_string", callback(current_token)))
-
-    # TODO: Add check if there is i % 2 == 1 at the end
-    return tokens
-
-
 class History:
     """Helper with wrapper, which is used when one wants to visualize the version control history
     of the project, printing specific stuff corresponding to a git history
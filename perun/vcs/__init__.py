@@ -30,17 +30,26 @@ def lookup_minor_version(func):
     f_args, _, _, _, *_ = inspect.getfullargspec(func)
     minor_version_position = f_args.index('minor_version')
 
-    def wrapper(*args, **kwargs):
-        """Inner wrapper of the function"""
-        # if the minor_version is None, then we obtain the minor head for the wrapped type
-        if minor_version_position < len(args) and args[minor_version_position] is None:
-            # note: since tuples are immutable we have to do this workaround
-            arg_list = list(args)
-            arg_list[minor_version_position] = get_minor_head()
-            args = tuple(arg_list)
-        else:
-            check_minor_version_validity(args[minor_version_position])
-        return func(*args, **kwargs)
+    if minor_version_position == 0:
+        def wrapper(*args, **kwargs):
+            """Inner wrapper of the function with minor_version as the first argument"""
+            # if the minor_version is None, then we obtain the minor head for the wrapped type
+            if args and args[0] is None:
+                args = (get_minor_head(), ) + args[1:]
+            else:
+                check_minor_version_validity(args[0])
+            return func(*args, **kwargs)
+    else:
+        def wrapper(*args, **kwargs):
+            """Inner wrapper of the function"""
+            # if the minor_version is None, then we obtain the minor head for the wrapped type
+            if minor_version_position < len(args) and args[minor_version_position] is None:
+                # note: since tuples are immutable we have to splice the head in
+                args = args[:minor_version_position] + (get_minor_head(), ) \
+                    + args[minor_version_position + 1:]
+            else:
+                check_minor_version_validity(args[minor_version_position])
+            return func(*args, **kwargs)
 
     return wrapper
 
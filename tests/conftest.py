@@ -246,6 +246,22 @@ def full_profiles():
     yield load_all_profiles_in("full_profiles")
 
 
+@pytest.fixture(scope="session")
+def degradation_profiles():
+    """
+    Returns:
+        dict: mapping of names of degradation profiles to the profiles loaded only once per session
+    """
+    pool_path = os.path.join(os.path.split(__file__)[0], 'profiles', 'degradation_profiles')
+    return {
+        profile_name: store.load_profile_from_file(os.path.join(pool_path, profile_name), True)
+        for profile_name in [
+            'linear_base.perf', 'linear_base_degradated.perf', 'quad_base.perf', 'zero.perf',
+            'tracer_baseline.perf', 'tracer_target.perf'
+        ]
+    }
+
+
 @pytest.fixture(scope="function")
 def pcs_with_degradations():
     """
@@ -301,6 +301,33 @@ def test_add_existing(pcs_full, valid_profile_pool, capsys):
     assert after_expected in (before_count[0], before_count[0]+1)
 
 
+def test_add_duplicate(pcs_full, valid_profile_pool, capsys):
+    """Test calling 'perun add profile profile', i.e. with the same profile listed twice
+
+    Expecting the profile to be added once and removed, and the second occurrence to be reported
+    as not existing profile.
+    """
+    git_repo = git.Repo(os.path.split(pcs_full.get_path())[0])
+    head = str(git_repo.head.commit)
+    obj_path = pcs_full.get_path()
+
+    valid_profile = test_utils.prepare_profile(
+        pcs_full.get_job_directory(), valid_profile_pool[0], head
+    )
+    before_entries_count = assert_before_add(obj_path, head, valid_profile)
+
+    with pytest.raises(SystemExit):
+        commands.add([valid_profile, valid_profile], None)
+
+    # Assert that the profile was added only once and then removed
+    after_entries_count = assert_after_valid_add(obj_path, head, valid_profile)
+    assert before_entries_count == (after_entries_count - 1)
+    assert not os.path.exists(valid_profile)
+
+    _, err = capsys.readouterr()
+    assert "{} does not exist".format(valid_profile) in err
+
+
 @pytest.mark.usefixtures('cleandir')
 def test_add_outside_pcs(valid_profile_pool):
     """Test calling 'perun add outside of the scope of the PCS wrapper
@@ -90,21 +90,20 @@ def test_degradation_in_history(pcs_with_degradations):
     assert check.PerformanceChange.Degradation in [r[0].result for r in result]
 
 
-def test_degradation_between_profiles(pcs_with_degradations, capsys):
+def test_degradation_between_profiles(pcs_with_degradations, capsys, degradation_profiles):
     """Set of basic tests for testing degradation between profiles
 
     Expects correct behaviour
     """
-    pool_path = os.path.join(os.path.split(__file__)[0], 'profiles', 'degradation_profiles')
     profiles = [
-        store.load_profile_from_file(os.path.join(pool_path, 'linear_base.perf'), True),
-        store.load_profile_from_file(os.path.join(pool_path, 'linear_base_degradated.perf'), True),
-        store.load_profile_from_file(os.path.join(pool_path, 'quad_base.perf'), True),
-        store.load_profile_from_file(os.path.join(pool_path, 'zero.perf'), True)
+        degradation_profiles['linear_base.perf'],
+        degradation_profiles['linear_base_degradated.perf'],
+        degradation_profiles['quad_base.perf'],
+        degradation_profiles['zero.perf']
     ]
     tracer_profiles = [
-        store.load_profile_from_file(os.path.join(pool_path, 'tracer_baseline.perf'), True),
-        store.load_profile_from_file(os.path.join(pool_path, 'tracer_target.perf'), True)
+        degradation_profiles['tracer_baseline.perf'],
+        degradation_profiles['tracer_target.perf']
     ]
 
     # Test degradation detection using ETO
@@ -170,13 +169,12 @@ def test_degradation_between_profiles(pcs_with_degradations, capsys):
     assert 'incompatible configurations' in err
 
 
-def test_strategies():
+def test_strategies(degradation_profiles):
     """Set of basic tests for handling the strategies
 
     Expects correct behaviour
     """
-    pool_path = os.path.join(os.path.split(__file__)[0], 'profiles', 'degradation_profiles')
-    profile = store.load_profile_from_file(os.path.join(pool_path, 'linear_base.perf'), True)
+    profile = degradation_profiles['linear_base.perf']
     rule = {
         'method': 'average_amount_threshold',
         'collector': 'complexity',
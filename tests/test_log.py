@@ -52,17 +52,31 @@ def test_log_on_no_vcs(pcs_without_vcs):
 def test_log_short_error(pcs_full, capsys, monkeypatch):
     cfg = config.Config('shared', '', {'format': {'shortlog': '%checksum:6% -> %notexist%'}})
     monkeypatch.setattr("perun.logic.config.shared", lambda: cfg)
-    decorators.remove_from_function_args_cache("lookup_key_recursively")
+    decorators.remove_from_function_args_cache("lookup_cached_key_recursively")
 
     with pytest.raises(SystemExit):
         commands.log(None, short=True)
 
-    decorators.remove_from_function_args_cache("lookup_key_recursively")
+    decorators.remove_from_function_args_cache("lookup_cached_key_recursively")
     out, err = capsys.readouterr()
     assert len(err) != 0
     assert "object does not contain 'notexist' attribute" in err
 
 
+def test_parse_formatting_string():
+    """Test parsing of the formatting strings into tokens with attribute types, limits and fills
+
+    Expecting that the tags are parsed into their parts and the rest is kept as it is.
+    """
+    tokens = commands.parse_formatting_string("%checksum:6% (%stats%) %desc:40f-% 100% done")
+    assert tokens == (
+        ('fmt_string', 'checksum', ':6', None), ('raw_string', ' (', None, None),
+        ('fmt_string', 'stats', None, None), ('raw_string', ') ', None, None),
+        ('fmt_string', 'desc', ':40', 'f-'), ('raw_string', ' 100% done', None, None)
+    )
+    assert commands.parse_formatting_string("") == ()
+
+
 def test_log_short(pcs_full, capsys):
     """Test calling 'perun log --short', which outputs shorter info
 
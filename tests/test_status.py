@@ -321,7 +321,7 @@ def test_status_sort(monkeypatch, pcs_full, capsys, valid_profile_pool):
     Expecting no errors and long display of the current status of the perun, with all profiles.
     """
     test_utils.populate_repo_with_untracked_profiles(pcs_full.get_path(), valid_profile_pool)
-    decorators.remove_from_function_args_cache("lookup_key_recursively")
+    decorators.remove_from_function_args_cache("lookup_cached_key_recursively")
 
     # Try what happens if we screw the stored profile keys ;)
     cfg = config.Config('shared', '', {
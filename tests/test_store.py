@@ -135,6 +135,16 @@ def test_helpers(tmpdir):
         assert stored_list == ['hello', 'dolly']
 
 
+def test_pack_and_hash():
+    """Test that packing and hashing in single pass is same as the separate calls"""
+    chunks = ["profile memory 42\0".encode('utf-8'), "Wow, such profile".encode('utf-8') * 100]
+    content = b"".join(chunks)
+
+    checksum, packed_content = store.pack_and_hash(chunks)
+    assert checksum == store.compute_checksum(content)
+    assert packed_content == store.pack_content(content)
+
+
 @pytest.mark.usefixtures('cleandir')
 def test_streams(tmpdir, monkeypatch):
     """Test various untested behaviour"""
@@ -1,4 +1,5 @@
 import shutil
+import io
 import os
 import glob
 import re
@@ -249,6 +250,103 @@ def test_collect_trace_utils(pcs_full):
     assert result.exit_code == 0
 
 
+def test_lock_file_parsing():
+    """Test parsing of the lock file names into the resource locks without the need of stap
+    """
+    # The resource name may contain additional ':' separators
+    lock = locks.ResourceLock.fromfile(os.path.join('locks', 'a:b:12.b_lock'))
+    assert lock.name == 'a:b' and lock.pid == 12 and lock.type == locks.LockType.Binary
+    assert lock.locks_dir == 'locks'
+    lock = locks.ResourceLock.fromfile('tst:4321.s_lock')
+    assert lock.name == 'tst' and lock.pid == 4321 and lock.type == locks.LockType.SystemTap
+
+    # Invalid suffixes, pids or missing parts
+    assert locks.LockType.suffix_to_type('.m_lock') == locks.LockType.Module
+    assert locks.LockType.suffix_to_type('.lock') is None
+    for invalid in ('tst:12.u_lock', 'tst:12.b_lockx', 'tst:1a2.b_lock', 'tst.b_lock',
+                    ':12.b_lock', 'tst:.b_lock', 'tst:12'):
+        assert locks.ResourceLock.fromfile(invalid) is None
+
+
+def test_lock_processes_ps(monkeypatch):
+    """Test resolving the running perun processes from the 'ps' output
+    """
+    queries = []
+
+    def mock_ps(cmd, *_, **__):
+        queries.append(cmd)
+        return (b"  PID  PPID  PGID CMD\n"
+                b"   11     1    11 python3 perun collect -c./tst trace\n"
+                b"   12     1    12 python3 perunx collect perun.txt\n"
+                b"   14     1    14 perun\n"
+                b"   15     1    15 python3 /usr/bin/perun status\n"), b""
+
+    monkeypatch.setattr(locks.sys, 'platform', 'darwin')
+    monkeypatch.setattr(locks.utils, 'run_safely_external_command', mock_ps)
+
+    # All the pids are queried at once, the pid 13 is missing in the output
+    running = locks._are_running_perun_processes([11, 12, 13, 14, 15])
+    assert running == {11: True, 12: False, 13: False, 14: True, 15: False}
+    assert len(queries) == 1 and queries[0].endswith('-p 11,12,13,14,15')
+
+    assert locks._is_running_perun_process(11)
+    assert not locks._is_running_perun_process(13)
+
+
+def test_lock_processes_proc(monkeypatch):
+    """Test resolving the running perun processes from the /proc cmdlines with the 'ps' fallback
+    """
+    cmdlines = {
+        '/proc/11/cmdline': b'python3\0perun\0collect\0',
+        '/proc/12/cmdline': b'python3\0perunx\0',
+    }
+    queries = []
+
+    def mock_open(path, *_, **__):
+        if path == '/proc/13/cmdline':
+            raise PermissionError(path)
+        if path not in cmdlines:
+            raise FileNotFoundError(path)
+        return io.BytesIO(cmdlines[path])
+
+    def mock_ps(cmd, *_, **__):
+        queries.append(cmd)
+        return b"  PID  PPID  PGID CMD\n   13     1    13 perun status\n", b""
+
+    monkeypatch.setattr(locks.sys, 'platform', 'linux')
+    monkeypatch.setattr(locks, 'open', mock_open, raising=False)
+    monkeypatch.setattr(locks.utils, 'run_safely_external_command', mock_ps)
+
+    # The /proc is sufficient for existing and missing processes
+    assert locks._are_running_perun_processes([11, 12, 15]) == {11: True, 12: False, 15: False}
+    assert not queries
+
+    # Unreadable cmdline falls back to the 'ps' for the given pid only
+    assert locks._are_running_perun_processes([11, 13]) == {11: True, 13: True}
+    assert len(queries) == 1 and queries[0].endswith('-p 13')
+
+
+def test_lock_scan(pcs_full):
+    """Test listing the active locks with the lock suffix prefilter
+    """
+    locks_dir = temp.temp_path(os.path.join('trace', 'locks_scan'))
+    temp.touch_temp_dir(locks_dir)
+    for lock_file in ('tst:11.b_lock', 'a:b:12.m_lock', 'tst:13.s_lock', 'other.txt',
+                      'tst:14.u_lock', 'tst:x15.b_lock', 'tst:16.b_lock.bak'):
+        temp.touch_temp_file(os.path.join(locks_dir, lock_file), protect=True)
+    # Directories with the lock suffix are skipped as well
+    temp.touch_temp_dir(os.path.join(locks_dir, 'dir:17.b_lock'))
+
+    active = locks.get_active_locks_for(locks_dir)
+    assert sorted(lock.pid for lock in active) == [11, 12, 13]
+    active = locks.get_active_locks_for(locks_dir, names=['tst'])
+    assert sorted(lock.pid for lock in active) == [11, 13]
+    active = locks.get_active_locks_for(
+        locks_dir, resource_types=[locks.LockType.Module, locks.LockType.SystemTap], pids=[12]
+    )
+    assert len(active) == 1 and active[0].name == 'a:b'
+
+
 def test_collect_trace(pcs_full, trace_collect_job):
     """Test running the trace collector from the CLI with parameter handling
 
@@ -304,7 +402,7 @@ def test_collect_trace(pcs_full, trace_collect_job):
         'trace',
     ] + func + usdt + binary)
     del config.runtime().data['format']
-    decorators.remove_from_function_args_cache("lookup_key_recursively")
+    decorators.remove_from_function_args_cache("lookup_cached_key_recursively")
     assert result.exit_code == 0
     pending_profiles = os.listdir(os.path.join(os.getcwd(), ".perun", "jobs"))
     assert "trace-profile.perf" in pending_profiles